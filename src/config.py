@@ -20,6 +20,7 @@ Configuration settings for the Java code analysis application.
 import logging
 from pathlib import Path
 from dataclasses import dataclass
+from typing import Optional
 
 
 class Config:
@@ -28,6 +29,7 @@ class Config:
     # File paths
     CLASSES_FILE = "java_classes.json"
     METHODS_FILE = "java_methods.json"
+    DATA_CACHE_FILE = ".javadata.pkl"
     OUTPUT_CLASSES_DIR = "generated/classes"
     OUTPUT_METHODS_DIR = "generated/methods"
 
@@ -82,5 +84,12 @@ class LLMConfig:
     model: str = "qwen3:8b"
     timeout: float = 60.0
     max_retries: int = 3
+    retry_backoff_base: float = 0.5
+    retry_backoff_cap: float = 10.0
     temperature: float = 0.3
     top_p: float = 0.9
+    concurrency: int = 8
+    model_cache_ttl: float = 60.0
+    cache_path: Optional[str] = None
+    # How long Ollama keeps the model loaded after a request, the default of 5 minutes unloads it between batches
+    keep_alive: str = "30m"
@@ -39,6 +39,9 @@ def generate_documentation(java_data: JavaCodeData, base_dir: str = '.'):
     class_doc_generator = ClassDocumentationGenerator(llm_config, Config.get_classes_output_dir(base_dir))
     method_doc_generator = MethodDocumentationGenerator(llm_config, Config.get_methods_output_dir(base_dir))
 
+    # Both generators talk to the same model, loading it once avoids a slow first request
+    class_doc_generator.warmup()
+
     # Generate documentation
     class_data = class_doc_generator.generate_documentation(java_data)
     update_class_data(java_data, class_data)
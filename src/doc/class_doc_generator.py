@@ -58,31 +58,34 @@ class ClassDocumentationGenerator(BaseDocumentationGenerator):
         self.logger.info(f"Found {len(classes_without_docs)} classes without documentation")
 
         generated_classes = []
+        completed = 0
 
-        for i, java_class in enumerate(classes_without_docs, 1):
+        def save_result(index: int, documentation: Optional[str]):
+            nonlocal completed
+            completed += 1
+            java_class = classes_without_docs[index]
             self.logger.info(
-                f"Processing class {i}/{len(classes_without_docs)}: {java_class.class_name}"
-            )
-
-            # Create context for the class
-            context = self._create_class_context(java_class, java_data)
-
-            # Generate documentation
-            documentation = self.javadoc_generator.generate_class_documentation(
-                java_class.code, context
+                f"Processing class {completed}/{len(classes_without_docs)}: {java_class.class_name}"
             )
 
             if documentation:
                 new_class = JavaUpdateClass(class_name=java_class.class_name, java_doc=documentation)
                 self.logger.debug(f"Generated docs for class {java_class.class_name}")
 
-                # Save to file immediately
+                # Save to file immediately, the update files are the checkpoint of an interrupted run
                 self._save_to_file(new_class.__to_dict__(), java_class.class_name)
 
                 generated_classes.append(new_class)
             else:
                 self.logger.warning(f"Failed to generate docs for class {java_class.class_name}")
 
+        # Generate documentation for all classes concurrently, each one is saved as soon as it is done
+        self.javadoc_generator.generate_class_documentation_many(
+            [(java_class.code, self._create_class_context(java_class, java_data))
+             for java_class in classes_without_docs],
+            on_result=save_result
+        )
+
         # Log final statistics
         self.logger.info(f"Generated files saved to: {self.output_dir}")
 
@@ -50,6 +50,10 @@ class BaseDocumentationGenerator(ABC):
         """Check if the generator is ready to use."""
         return self.javadoc_generator.is_ready()
     
+    def warmup(self) -> bool:
+        """Load the model before the first documentation request."""
+        return self.javadoc_generator.warmup()
+    
     def _save_to_file(self, data: Dict[str, Any], entity_name: str):
         """
         Save documentation data to a JSON file.
@@ -17,11 +17,14 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 JavaDoc documentation generator using LLM.
 Specialized layer for generating JavaDoc comments.
 """
+import asyncio
 import logging
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 from llm.llm_access import LLMAccessLayer
 from config import LLMConfig
 
+STOP_SEQUENCES = ['```', 'Java Code:', 'Context:', 'Example:']
+
 
 class JavaDocLLMGenerator:
     """Specialized generator for JavaDoc documentation using LLM."""
@@ -64,6 +67,40 @@ class JavaDocLLMGenerator:
         prompt = self._create_class_documentation_prompt(java_code, context)
         return self._generate_and_extract_javadoc(prompt)
     
+    def generate_method_documentation_many(self,
+                                          items: List[Tuple[str, Optional[str]]],
+                                          on_result: Optional[Callable[[int, Optional[str]], None]] = None
+                                          ) -> List[Optional[str]]:
+        """
+        Generate JavaDoc documentation for several Java methods concurrently.
+        
+        Args:
+            items: List of (java_code, context) tuples
+            on_result: Called with the item index and its JavaDoc as soon as that item is done
+        
+        Returns:
+            Generated JavaDoc strings in input order, None where generation failed
+        """
+        prompts = [self._create_method_documentation_prompt(java_code, context) for java_code, context in items]
+        return self._generate_and_extract_javadoc_many(prompts, on_result)
+    
+    def generate_class_documentation_many(self,
+                                          items: List[Tuple[str, Optional[str]]],
+                                          on_result: Optional[Callable[[int, Optional[str]], None]] = None
+                                          ) -> List[Optional[str]]:
+        """
+        Generate JavaDoc documentation for several Java classes concurrently.
+        
+        Args:
+            items: List of (java_code, context) tuples
+            on_result: Called with the item index and its JavaDoc as soon as that item is done
+        
+        Returns:
+            Generated JavaDoc strings in input order, None where generation failed
+        """
+        prompts = [self._create_class_documentation_prompt(java_code, context) for java_code, context in items]
+        return self._generate_and_extract_javadoc_many(prompts, on_result)
+    
     def generate_field_documentation(self, java_code: str, context: Optional[str] = None) -> Optional[str]:
         """
         Generate JavaDoc documentation for a Java field.
@@ -82,9 +119,34 @@ class JavaDocLLMGenerator:
         """Generate response and extract JavaDoc from it."""
         response = self.llm_access.generate_response(
             prompt=prompt,
-            stop_sequences=['```', 'Java Code:', 'Context:', 'Example:']
+            stop_sequences=STOP_SEQUENCES
         )
+        return self._extract_javadoc_from_response(response)
+    
+    def _generate_and_extract_javadoc_many(self,
+                                           prompts: List[str],
+                                           on_result: Optional[Callable[[int, Optional[str]], None]] = None
+                                           ) -> List[Optional[str]]:
+        """Generate responses for all prompts concurrently and extract JavaDoc from each as it arrives."""
+        documentations: List[Optional[str]] = [None] * len(prompts)
+        
+        def extract(index: int, response: Optional[str]):
+            documentations[index] = self._extract_javadoc_from_response(response)
+            if on_result is not None:
+                on_result(index, documentations[index])
+        
+        async def generate():
+            try:
+                await self.llm_access.generate_many(prompts, on_result=extract, stop_sequences=STOP_SEQUENCES)
+            finally:
+                # the async client is bound to the loop of this run, close it before asyncio.run ends the loop
+                await self.llm_access.aclose()
         
+        asyncio.run(generate())
+        return documentations
+    
+    def _extract_javadoc_from_response(self, response: Optional[str]) -> Optional[str]:
+        """Extract JavaDoc from a LLM response, logging the outcome."""
         if response:
             documentation = self._extract_javadoc(response)
             if documentation:
@@ -209,6 +271,10 @@ Rules:
         """Pull the model if it's not available."""
         return self.llm_access.pull_model()
     
+    def warmup(self) -> bool:
+        """Load the model before the first documentation request."""
+        return self.llm_access.warmup()
+    
     def list_available_models(self) -> list:
         """Get a list of available models."""
         return self.llm_access.list_available_models()
\ No newline at end of file
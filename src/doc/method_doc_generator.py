@@ -58,30 +58,33 @@ class MethodDocumentationGenerator(BaseDocumentationGenerator):
         self.logger.info(f"Found {len(methods_without_docs)} methods without documentation")
 
         generated_methods = []
+        completed = 0
 
-        for i, method in enumerate(methods_without_docs, 1):
+        def save_result(index: int, documentation: Optional[str]):
+            nonlocal completed
+            completed += 1
+            method = methods_without_docs[index]
             self.logger.info(
-                f"Processing method {i}/{len(methods_without_docs)}: "
+                f"Processing method {completed}/{len(methods_without_docs)}: "
                 f"{method.src}"
             )
 
-            # Create context for the method
-            context = self._create_method_context(method, java_data)
-
-            # Generate documentation
-            documentation = self.javadoc_generator.generate_method_documentation(
-                method.code, context
-            )
-
             if documentation:
                 new_method = JavaUpdateMethod(src=method.src, java_doc=documentation)
                 self.logger.debug(f"Generated docs for {method.src}")
 
+                # Save to file immediately, the update files are the checkpoint of an interrupted run
                 self._save_to_file(new_method.__to_dict__(), f"{method.src}")
                 generated_methods.append(method)
             else:
                 self.logger.warning(f"Failed to generate docs for {method.src}")
 
+        # Generate documentation for all methods concurrently, each one is saved as soon as it is done
+        self.javadoc_generator.generate_method_documentation_many(
+            [(method.code, self._create_method_context(method, java_data)) for method in methods_without_docs],
+            on_result=save_result
+        )
+
         self.logger.info(f"Generated files saved to: {self.output_dir}")
 
         return generated_methods
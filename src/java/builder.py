@@ -15,7 +15,9 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 """
+import io
 import logging
+import pickle
 import sys
 from pathlib import Path
 
@@ -27,6 +29,10 @@ from .utils import is_valid_method, is_valid_class
 
 logger = logging.getLogger(__name__)
 
+# Part of the data cache key, bump it whenever the models in java/models.py or the filtering in
+# remove_unwanted/is_valid_method/is_valid_class change, so a pickle written by older code is not used
+_CACHE_VERSION = 1
+
 
 def remove_unwanted(java_data: JavaCodeData):
     base = JavaCodeData(classes=[data for data in java_data.classes if is_valid_class(data)],
@@ -78,56 +84,104 @@ def read_structure(base_path: str = ".") -> JavaCodeData:
         sys.exit(1)
 
 
+def _data_fingerprint(base_path: str) -> tuple:
+    """Cache version plus name, modification time and size of every file read_structure reads."""
+    classes_file, methods_file = Config.get_data_files_path(base_path)
+    files = [classes_file, methods_file]
+    for directory in (Config.get_classes_output_dir(base_path), Config.get_methods_output_dir(base_path)):
+        files.extend(Path(directory).glob("*.json"))
+    fingerprint = []
+    for file_path in sorted(files):
+        stat = file_path.stat()
+        fingerprint.append((str(file_path), stat.st_mtime_ns, stat.st_size))
+    return _CACHE_VERSION, fingerprint
+
+
+def read_structure_cached(base_path: str = ".") -> JavaCodeData:
+    """
+    Read the Java code data like read_structure, reusing a pickled copy while none of the input files changed.
+
+    Args:
+        base_path: Base directory path where data files are located
+
+    Returns:
+        The Java code data
+    """
+    cache_file = Path(base_path) / Config.DATA_CACHE_FILE
+    try:
+        fingerprint = _data_fingerprint(base_path)
+    except OSError:
+        # let read_structure report the missing files
+        return read_structure(base_path)
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_fingerprint, java_data = pickle.load(f)
+        if cached_fingerprint == fingerprint:
+            logger.info(f"Using cached Java code data from {cache_file}")
+            return java_data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable data cache {cache_file}: {e}")
+
+    java_data = read_structure(base_path)
+    try:
+        with open(cache_file, 'wb') as f:
+            pickle.dump((fingerprint, java_data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.warning(f"Failed to write data cache {cache_file}: {e}")
+    return java_data
+
+
 def print_data_summary(java_data: JavaCodeData):
     """Print a summary of the loaded data."""
-    print("\n" + "=" * 50)
-    print("JAVA CODE DATA SUMMARY")
-    print("=" * 50)
-    print(f"Total Classes: {len(java_data.classes)}")
-    print(f"Total Methods: {len(java_data.methods)}")
-
-    print("\nClasses:")
-    for java_class in java_data.classes:
-        doc_status = "✓" if java_class.java_doc else "✗"
-        print(f"  {doc_status} {java_class.class_name}")
+    buf = io.StringIO()
+    buf.write("\n" + "=" * 50 + "\n")
+    buf.write("JAVA CODE DATA SUMMARY\n")
+    buf.write("=" * 50 + "\n")
+    buf.write(f"Total Classes: {len(java_data.classes)}\n")
+    buf.write(f"Total Methods: {len(java_data.methods)}\n")
 
-    print("\nMethods by Class:")
-    class_method_count = {}
-    for method in java_data.methods:
-        class_name = method.src.class_name
-        class_method_count[class_name] = class_method_count.get(class_name, 0) + 1
+    buf.write("\nClasses:\n")
+    buf.write(''.join(f"  {'✓' if java_class.java_doc else '✗'} {java_class.class_name}\n"
+                      for java_class in java_data.classes))
 
-    for class_name, count in class_method_count.items():
-        print(f"  {class_name}: {count} methods")
+    buf.write("\nMethods by Class:\n")
+    class_method_count = java_data.get_method_counts_by_class()
+    buf.write(''.join(f"  {class_name}: {count} methods\n" for class_name, count in class_method_count.items()))
+    sys.stdout.write(buf.getvalue())
 
 
 def demonstrate_data_access(java_data: JavaCodeData):
     """Demonstrate how to access the loaded data."""
-    print("\n" + "=" * 50)
-    print("DATA ACCESS EXAMPLES")
-    print("=" * 50)
+    buf = io.StringIO()
+    buf.write("\n" + "=" * 50 + "\n")
+    buf.write("DATA ACCESS EXAMPLES\n")
+    buf.write("=" * 50 + "\n")
 
     if java_data.classes:
         # Show first class details
         first_class = java_data.classes[0]
-        print(f"\nFirst Class: {first_class.class_name}")
-        print(f"Has JavaDoc: {'Yes' if first_class.java_doc else 'No'}")
-        print(f"Code length: {len(first_class.code)} characters")
+        buf.write(f"\nFirst Class: {first_class.class_name}\n")
+        buf.write(f"Has JavaDoc: {'Yes' if first_class.java_doc else 'No'}\n")
+        buf.write(f"Code length: {len(first_class.code)} characters\n")
 
         # Show methods for this class
         class_methods = java_data.get_methods_by_class(first_class.class_name)
-        print(f"Methods in this class: {len(class_methods)}")
+        buf.write(f"Methods in this class: {len(class_methods)}\n")
 
         for method in class_methods:
-            print(f"  - {method.src.method_name}")
+            buf.write(f"  - {method.src.method_name}\n")
             if method.dst_methods:
-                print(f"    Dependencies: {len(method.dst_methods)}")
+                buf.write(f"    Dependencies: {len(method.dst_methods)}\n")
                 for dep in method.dst_methods:
-                    print(f"      → {dep.class_name}.{dep.method_name}")
+                    buf.write(f"      → {dep.class_name}.{dep.method_name}\n")
 
     if java_data.methods:
         # Show method with most dependencies
         method_with_most_deps = max(java_data.methods, key=lambda m: len(m.dst_methods))
-        print(f"\nMethod with most dependencies:")
-        print(f"  {method_with_most_deps.src.class_name}.{method_with_most_deps.src.method_name}")
-        print(f"  Dependencies: {len(method_with_most_deps.dst_methods)}")
+        buf.write(f"\nMethod with most dependencies:\n")
+        buf.write(f"  {method_with_most_deps.src.class_name}.{method_with_most_deps.src.method_name}\n")
+        buf.write(f"  Dependencies: {len(method_with_most_deps.dst_methods)}\n")
+    sys.stdout.write(buf.getvalue())
@@ -18,8 +18,9 @@ Module for reading Java code data from JSON files.
 """
 import json
 import logging
+import sys
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 from .models import (
     JavaClass, JavaMethod, JavaCodeData,
@@ -33,6 +34,8 @@ class JavaDataReader:
     def __init__(self):
         """Initialize the data reader."""
         self.logger = logging.getLogger(__name__)
+        # Shared MethodReference instances, many methods call the same targets
+        self._ref_cache: Dict[Tuple[str, str], MethodReference] = {}
 
     def read_classes_file(self, file_path: Path) -> List[JavaClass]:
         """
@@ -133,6 +136,8 @@ class JavaDataReader:
         """
         self.logger.info("Reading Java code data from files")
 
+        # Read one after the other, both readers spend their time in json.loads and dataclass
+        # construction which hold the GIL, reading them in two threads measured no faster
         classes = self.read_classes_file(classes_file)
         methods = self.read_methods_file(methods_file)
 
@@ -149,7 +154,7 @@ class JavaDataReader:
         """Parse a single class data dictionary into a JavaClass object."""
         try:
             return JavaClass(
-                class_name=data['className'],
+                class_name=sys.intern(data['className']),
                 java_doc=data.get('javaDoc'),
                 code=data['code']
             )
@@ -160,19 +165,16 @@ class JavaDataReader:
         """Parse a single method data dictionary into a JavaMethod object."""
         try:
             # Parse source method information
-            src_data = data['src']
-            src = MethodSource(
-                class_name=src_data['className'],
-                method_name=src_data['methodName']
-            )
+            src = MethodSource._fast_new(*self._parse_method_key(data['src']))
 
             # Parse destination methods (dependencies)
             dst_methods = []
             for dst_data in data.get('dstMethods', []):
-                dst_method = MethodReference(
-                    class_name=dst_data['className'],
-                    method_name=dst_data['methodName']
-                )
+                key = self._parse_method_key(dst_data)
+                dst_method = self._ref_cache.get(key)
+                if dst_method is None:
+                    dst_method = MethodReference._fast_new(*key)
+                    self._ref_cache[key] = dst_method
                 dst_methods.append(dst_method)
 
             return JavaMethod(
@@ -182,4 +184,13 @@ class JavaDataReader:
                 dst_methods=dst_methods
             )
         except KeyError as e:
-            raise ValueError(f"Missing required field in method data: {e}")
\ No newline at end of file
+            raise ValueError(f"Missing required field in method data: {e}")
+
+    @staticmethod
+    def _parse_method_key(data: Dict[str, Any]) -> Tuple[str, str]:
+        """Extract and validate the interned (class name, method name) pair of a method entry."""
+        class_name = data['className']
+        method_name = data['methodName']
+        if not class_name or not method_name:
+            raise ValueError("Class name and method name cannot be empty")
+        return sys.intern(class_name), sys.intern(method_name)
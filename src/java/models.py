@@ -16,8 +16,8 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 Data models for representing Java code structure.
 """
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 
 @dataclass
@@ -77,6 +77,14 @@ class MethodReference:
         if not self.class_name or not self.method_name:
             raise ValueError("Class name and method name cannot be empty")
 
+    @classmethod
+    def _fast_new(cls, class_name: str, method_name: str):
+        """Create an instance without validation, for callers that already validated the names."""
+        obj = object.__new__(cls)
+        obj.class_name = class_name
+        obj.method_name = method_name
+        return obj
+
 
 @dataclass
 class MethodSource:
@@ -92,6 +100,14 @@ class MethodSource:
         if not self.class_name or not self.method_name:
             raise ValueError("Class name and method name cannot be empty")
 
+    @classmethod
+    def _fast_new(cls, class_name: str, method_name: str):
+        """Create an instance without validation, for callers that already validated the names."""
+        obj = object.__new__(cls)
+        obj.class_name = class_name
+        obj.method_name = method_name
+        return obj
+
 
 @dataclass
 class JavaMethod:
@@ -154,11 +170,20 @@ class JavaUpdateMethod:
         }
 
 
+# Node of the method call graph, (class_name, method_name) or "class.method"
+GraphNode = Union[Tuple[str, str], str]
+
+
 @dataclass
 class JavaCodeData:
     """Container for all Java code data."""
     classes: List[JavaClass]
     methods: List[JavaMethod]
+    # Lookup caches, built on first use and dropped when classes/methods are replaced
+    _methods_by_class_cache: Optional[Dict[str, List[JavaMethod]]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _method_index_cache: Optional[Dict[Tuple[str, str], JavaMethod]] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate data after initialization."""
@@ -167,6 +192,30 @@ class JavaCodeData:
         if self.methods is None:
             self.methods = []
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ('classes', 'methods'):
+            super().__setattr__('_methods_by_class_cache', None)
+            super().__setattr__('_method_index_cache', None)
+
+    def _methods_by_class(self) -> Dict[str, List[JavaMethod]]:
+        """Group all methods by their class name, cached after the first call."""
+        if self._methods_by_class_cache is None:
+            methods_by_class: Dict[str, List[JavaMethod]] = {}
+            for method in self.methods:
+                methods_by_class.setdefault(method.src.class_name, []).append(method)
+            self._methods_by_class_cache = methods_by_class
+        return self._methods_by_class_cache
+
+    def _method_index(self) -> Dict[Tuple[str, str], JavaMethod]:
+        """Index all methods by (class name, method name), cached after the first call."""
+        if self._method_index_cache is None:
+            method_index: Dict[Tuple[str, str], JavaMethod] = {}
+            for method in self.methods:
+                method_index.setdefault((method.src.class_name, method.src.method_name), method)
+            self._method_index_cache = method_index
+        return self._method_index_cache
+
     def get_class_by_name(self, class_name: str) -> Optional[JavaClass]:
         """Find a class by its name."""
         for java_class in self.classes:
@@ -176,20 +225,80 @@ class JavaCodeData:
 
     def get_methods_by_class(self, class_name: str) -> List[JavaMethod]:
         """Get all methods for a specific class."""
-        return [method for method in self.methods
-                if method.src.class_name == class_name]
+        return list(self._methods_by_class().get(class_name, ()))
+
+    def get_methods_grouped_by_class(self) -> Dict[str, List[JavaMethod]]:
+        """Get all methods grouped by class name, the mapping is cached and shared so it must not be modified."""
+        return self._methods_by_class()
+
+    def get_method_counts_by_class(self) -> Dict[str, int]:
+        """Get the number of methods for each class that has methods."""
+        return {class_name: len(methods) for class_name, methods in self._methods_by_class().items()}
 
     def get_method_dependencies(self, class_name: str, method_name: str) -> List[MethodReference]:
         """Get all method dependencies for a specific method."""
-        for method in self.methods:
-            if (method.src.class_name == class_name and
-                    method.src.method_name == method_name):
-                return method.dst_methods
-        return []
+        method = self._method_index().get((class_name, method_name))
+        return method.dst_methods if method is not None else []
 
     def get_method_by_name(self, src: MethodSource) -> Optional[JavaMethod]:
+        return self._method_index().get((src.class_name, src.method_name))
+
+    def get_dependency_graph(self, as_strings: bool = False) -> Dict[GraphNode, List[GraphNode]]:
+        """
+        Build the method call graph as an adjacency mapping.
+
+        Args:
+            as_strings: Use "class.method" strings instead of (class_name, method_name) tuples as nodes
+
+        Returns:
+            Dictionary mapping each method to the list of methods it calls, overloads share one node
+        """
+        graph: Dict[GraphNode, List[GraphNode]] = {}
+        seen: Dict[GraphNode, Set[GraphNode]] = {}
+        for m in self.methods:
+            src: GraphNode
+            dst_methods: List[GraphNode]
+            if as_strings:
+                src = f"{m.src.class_name}.{m.src.method_name}"
+                dst_methods = [f"{d.class_name}.{d.method_name}" for d in m.dst_methods]
+            else:
+                src = (m.src.class_name, m.src.method_name)
+                dst_methods = [(d.class_name, d.method_name) for d in m.dst_methods]
+            # overloads map to the same node, so merge their edges instead of replacing them
+            edges = graph.setdefault(src, [])
+            known = seen.setdefault(src, set())
+            for dst in dst_methods:
+                if dst not in known:
+                    known.add(dst)
+                    edges.append(dst)
+        return graph
+
+    def get_strongly_connected_components(self) -> Dict[Tuple[str, str], int]:
+        """
+        Compute the strongly connected components of the method call graph.
+
+        Returns:
+            Dictionary mapping each (class_name, method_name) node to its component label
+        """
+        # imported lazily, only needed for graph analysis
+        import numpy as np
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import connected_components
+
+        method_ids: Dict[Tuple[str, str], int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        # edges straight from the methods, overloads share a node and duplicate edges are summed by csr_matrix
         for method in self.methods:
-            if (method.src.class_name == src.class_name and
-                    method.src.method_name == src.method_name):
-                return method
-        return None
+            src_id = method_ids.setdefault((method.src.class_name, method.src.method_name), len(method_ids))
+            for dst in method.dst_methods:
+                rows.append(src_id)
+                cols.append(method_ids.setdefault((dst.class_name, dst.method_name), len(method_ids)))
+
+        size = len(method_ids)
+        graph = csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (np.array(rows, dtype=np.int32), np.array(cols, dtype=np.int32))),
+            shape=(size, size)
+        )
+        _, labels = connected_components(graph, directed=True, connection='strong')
+        return {key: int(labels[method_id]) for key, method_id in method_ids.items()}
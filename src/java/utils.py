@@ -16,15 +16,19 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 Utility functions for Java code analysis.
 """
+import functools
+
 from java.models import  JavaClass, JavaMethod
 
+_INVALID_METHOD_NAMES = frozenset({"equals", "hashCode", "toString", "clone", "finalize", "wait", "notify", "notifyAll"})
+
+
 def is_valid_method( method: JavaMethod) -> bool:
+    if method.src.method_name in _INVALID_METHOD_NAMES:
+        return False
     if get_class_name_from_qualified_name(method.src.class_name) == method.src.method_name:
         # constructor
         return False
-    invalid_method_names = ["equals", "hashCode", "toString", "clone", "finalize", "wait", "notify", "notifyAll"]
-    if method.src.method_name in invalid_method_names:
-        return False
     return True
 
 def is_valid_class( clazz: JavaClass) -> bool:
@@ -34,6 +38,7 @@ def is_valid_class( clazz: JavaClass) -> bool:
     return True
 
 
+@functools.lru_cache(maxsize=None)
 def get_class_name_from_qualified_name( qualified_name: str) -> str:
     """Extract class name from fully qualified name."""
     return qualified_name.split('.')[-1]
\ No newline at end of file
@@ -17,10 +17,73 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 Technical LLM access layer for interacting with Ollama.
 This is a generic layer that can be used for various LLM tasks.
 """
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+import random
+import threading
+import time
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Tuple, Set, Callable
+import json
+import httpx
 import ollama
 from config import LLMConfig
+from llm.llm_cache import LLMCache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+class _FastJSONClient(ollama.Client):
+    """Ollama client decoding the API responses with orjson when it is installed."""
+    
+    def _request(self, cls, *args, stream: bool = False, **kwargs):
+        if stream:
+            
+            def inner():
+                with self._client.stream(*args, **kwargs) as r:
+                    try:
+                        r.raise_for_status()
+                    except httpx.HTTPStatusError as e:
+                        e.response.read()
+                        raise ollama.ResponseError(e.response.text, e.response.status_code) from None
+                    
+                    for line in r.iter_lines():
+                        part = _json_loads(line)
+                        if err := part.get('error'):
+                            raise ollama.ResponseError(err)
+                        yield cls(**part)
+            
+            return inner()
+        
+        return cls(**_json_loads(self._request_raw(*args, **kwargs).content))
+
+
+class _FastJSONAsyncClient(ollama.AsyncClient):
+    """Async counterpart of _FastJSONClient."""
+    
+    async def _request(self, cls, *args, stream: bool = False, **kwargs):
+        if stream:
+            
+            async def inner():
+                async with self._client.stream(*args, **kwargs) as r:
+                    try:
+                        r.raise_for_status()
+                    except httpx.HTTPStatusError as e:
+                        await e.response.aread()
+                        raise ollama.ResponseError(e.response.text, e.response.status_code) from None
+                    
+                    async for line in r.aiter_lines():
+                        part = _json_loads(line)
+                        if err := part.get('error'):
+                            raise ollama.ResponseError(err)
+                        yield cls(**part)
+            
+            return inner()
+        
+        return cls(**_json_loads((await self._request_raw(*args, **kwargs)).content))
 
 
 class LLMAccessLayer:
@@ -31,8 +94,45 @@ class LLMAccessLayer:
         self.config = config or LLMConfig()
         self.logger = logging.getLogger(__name__)
         
-        # Initialize the ollama client with custom host if specified
-        self.client = ollama.Client(host=self.config.host)
+        # Initialize the ollama client with custom host if specified, keeping
+        # connections alive between calls so each request skips the TCP setup
+        self.client = _FastJSONClient(host=self.config.host, limits=self._connection_limits())
+        self._aclient: Optional[ollama.AsyncClient] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Result of client.list(), reused until it is older than config.model_cache_ttl
+        self._models_cache: Optional[List[Any]] = None
+        self._model_names_cache: Set[str] = set()
+        self._models_cache_time = 0.0
+        # agenerate_response checks the model from worker threads, only one of them should list the models
+        self._models_cache_lock = threading.Lock()
+        
+        # Optional persistent cache of generated responses
+        self.cache = LLMCache(self.config.cache_path) if self.config.cache_path else None
+    
+    @property
+    def aclient(self) -> ollama.AsyncClient:
+        """Async ollama client for the running event loop, pooled connections cannot be shared between loops."""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = _FastJSONAsyncClient(host=self.config.host, limits=self._connection_limits())
+            self._aclient_loop = loop
+        return self._aclient
+    
+    async def aclose(self):
+        """Close the async client, call it before its event loop ends so the pooled connections are released."""
+        if self._aclient is not None:
+            aclient, self._aclient, self._aclient_loop = self._aclient, None, None
+            await aclient._client.aclose()
+    
+    def _connection_limits(self) -> httpx.Limits:
+        """Connection pool limits sized for the configured request concurrency."""
+        return httpx.Limits(
+            max_keepalive_connections=self.config.concurrency * 2,
+            max_connections=self.config.concurrency * 4,
+            # httpx closes idle connections after 5s by default, shorter than a typical generation
+            keepalive_expiry=60.0
+        )
     
     def is_service_available(self) -> bool:
         """Check if Ollama service is available."""
@@ -43,6 +143,25 @@ class LLMAccessLayer:
             self.logger.debug(f"Ollama service check failed: {e}")
             return False
     
+    def _list_models(self) -> List[Any]:
+        """Get the models known to Ollama, listing them again only when the cache has expired."""
+        return self._refresh_models_cache()[0]
+    
+    def _list_model_names(self) -> Set[str]:
+        """Get the names of the models known to Ollama, cached like _list_models."""
+        return self._refresh_models_cache()[1]
+    
+    def _refresh_models_cache(self) -> Tuple[List[Any], Set[str]]:
+        """List the models again if the cache has expired and return the models with their names."""
+        with self._models_cache_lock:
+            now = time.monotonic()
+            if self._models_cache is None or now - self._models_cache_time >= self.config.model_cache_ttl:
+                models = self.client.list().get('models', [])
+                self._models_cache = models
+                self._model_names_cache = {model.model for model in models}
+                self._models_cache_time = now
+            return self._models_cache, self._model_names_cache
+    
     def is_model_available(self, model_name: str = None) -> bool:
         """
         Check if the specified model is available.
@@ -56,17 +175,16 @@ class LLMAccessLayer:
         model_to_check = model_name or self.config.model
         
         try:
-            models = self.client.list()
-            model_names = [model.model for model in models.get('models', [])]
+            model_names = self._list_model_names()
             
             # Check if exact model name exists or if it's a partial match
-            for available_model in model_names:
-                if (model_to_check in available_model or 
-                    available_model.startswith(model_to_check)):
-                    return True
+            if model_to_check in model_names:
+                return True
+            if any(model_to_check in available_model for available_model in model_names):
+                return True
             
             self.logger.warning(
-                f"Model '{model_to_check}' not found. Available models: {model_names}"
+                f"Model '{model_to_check}' not found. Available models: {sorted(model_names)}"
             )
             return False
             
@@ -81,7 +199,8 @@ class LLMAccessLayer:
                          temperature: float = None,
                          top_p: float = None,
                          stop_sequences: List[str] = None,
-                         max_retries: int = None) -> Optional[str]:
+                         max_retries: int = None,
+                         deadline: float = None) -> Optional[str]:
         """
         Generate a response from the LLM.
         
@@ -93,14 +212,18 @@ class LLMAccessLayer:
             top_p: Top-p sampling parameter, defaults to config value
             stop_sequences: List of stop sequences
             max_retries: Maximum retry attempts, defaults to config value
+            deadline: time.monotonic() value after which no further attempt is started
             
         Returns:
             Generated response string or None if failed
         """
         model_name = model or self.config.model
-        temp = temperature if temperature is not None else self.config.temperature
-        top_p_val = top_p if top_p is not None else self.config.top_p
         retries = max_retries if max_retries is not None else self.config.max_retries
+        options = self._build_options(temperature, top_p, stop_sequences)
+        
+        cache_key, cached = self._get_cached_response(model_name, prompt, options)
+        if cached is not None:
+            return cached
         
         # Check if model is available before proceeding
         if not self.is_model_available(model_name):
@@ -111,50 +234,254 @@ class LLMAccessLayer:
             try:
                 self.logger.debug(f"Making LLM request (attempt {attempt + 1}/{retries})")
                 
-                options = {
-                    'temperature': temp,
-                    'top_p': top_p_val,
-                }
-                
-                if stop_sequences:
-                    options['stop'] = stop_sequences
                 # self.logger.debug(f"Prompt: {prompt}")
                 response = self.client.generate(
                     model=model_name,
                     prompt=prompt,
                     stream=stream,
-                    options=options
+                    options=options,
+                    keep_alive=self.config.keep_alive
                 )
                 
                 if stream:
                     # Handle streaming response
-                    return self._handle_streaming_response(response)
+                    result = self._collect_streaming_response(response)
+                    self._set_cached_response(cache_key, result)
+                    return result
                 else:
                     # Handle non-streaming response
                     result = response.get('response', '').strip()
                     if result:
                         self.logger.debug("Successfully generated LLM response")
+                        self._set_cached_response(cache_key, result)
                         return result
                 
             except ollama.ResponseError as e:
                 self.logger.warning(f"Ollama API error on attempt {attempt + 1}: {e}")
+                if not self._is_retryable(e):
+                    return None
                 if attempt == retries - 1:
                     self.logger.error("All attempts failed due to API errors")
             except Exception as e:
                 self.logger.warning(f"Request failed on attempt {attempt + 1}: {e}")
+                if not self._is_retryable(e):
+                    return None
                 if attempt == retries - 1:
                     self.logger.error("All attempts failed to generate response")
+            
+            delay = self._retry_delay(attempt, retries, deadline)
+            if delay is None:
+                break
+            time.sleep(delay)
         
         return None
     
-    def _handle_streaming_response(self, response) -> str:
-        """Handle streaming response from Ollama."""
-        full_response = ""
+    async def agenerate_response(self,
+                                 prompt: str,
+                                 model: str = None,
+                                 temperature: float = None,
+                                 top_p: float = None,
+                                 stop_sequences: List[str] = None,
+                                 max_retries: int = None,
+                                 deadline: float = None) -> Optional[str]:
+        """
+        Generate a response from the LLM without blocking the event loop.
+        
+        Args:
+            prompt: The input prompt
+            model: Model to use, defaults to config model
+            temperature: Sampling temperature, defaults to config value
+            top_p: Top-p sampling parameter, defaults to config value
+            stop_sequences: List of stop sequences
+            max_retries: Maximum retry attempts, defaults to config value
+            deadline: time.monotonic() value after which no further attempt is started
+        
+        Returns:
+            Generated response string or None if failed
+        """
+        model_name = model or self.config.model
+        retries = max_retries if max_retries is not None else self.config.max_retries
+        options = self._build_options(temperature, top_p, stop_sequences)
+        
+        cache_key, cached = self._get_cached_response(model_name, prompt, options)
+        if cached is not None:
+            return cached
+        
+        # Check if model is available before proceeding
+        if not await asyncio.to_thread(self.is_model_available, model_name):
+            self.logger.error(f"Model '{model_name}' is not available")
+            return None
+        
+        for attempt in range(retries):
+            try:
+                self.logger.debug(f"Making async LLM request (attempt {attempt + 1}/{retries})")
+                
+                response = await self.aclient.generate(
+                    model=model_name,
+                    prompt=prompt,
+                    options=options,
+                    keep_alive=self.config.keep_alive
+                )
+                
+                result = response.get('response', '').strip()
+                if result:
+                    self.logger.debug("Successfully generated LLM response")
+                    self._set_cached_response(cache_key, result)
+                    return result
+            
+            except ollama.ResponseError as e:
+                self.logger.warning(f"Ollama API error on attempt {attempt + 1}: {e}")
+                if not self._is_retryable(e):
+                    return None
+                if attempt == retries - 1:
+                    self.logger.error("All attempts failed due to API errors")
+            except Exception as e:
+                self.logger.warning(f"Request failed on attempt {attempt + 1}: {e}")
+                if not self._is_retryable(e):
+                    return None
+                if attempt == retries - 1:
+                    self.logger.error("All attempts failed to generate response")
+            
+            delay = self._retry_delay(attempt, retries, deadline)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+        
+        return None
+    
+    async def generate_many(self,
+                            prompts: List[str],
+                            concurrency: int = None,
+                            on_result: Optional[Callable[[int, Optional[str]], None]] = None,
+                            **kwargs) -> List[Optional[str]]:
+        """
+        Generate responses for several independent prompts concurrently.
+        
+        Args:
+            prompts: The input prompts
+            concurrency: Maximum number of requests in flight, defaults to config value
+            on_result: Called with the prompt index and its response as soon as that prompt is done
+            **kwargs: Further arguments for agenerate_response
+        
+        Returns:
+            List of generated response strings (None for failed prompts), in prompt order
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.config.concurrency)
+        return await asyncio.gather(
+            *[self._bounded(semaphore, index, prompt, on_result, **kwargs) for index, prompt in enumerate(prompts)]
+        )
+    
+    async def _bounded(self,
+                       semaphore: asyncio.Semaphore,
+                       index: int,
+                       prompt: str,
+                       on_result: Optional[Callable[[int, Optional[str]], None]],
+                       **kwargs) -> Optional[str]:
+        """Run agenerate_response once a semaphore slot is free and report the result."""
+        async with semaphore:
+            response = await self.agenerate_response(prompt, **kwargs)
+        if on_result is not None:
+            on_result(index, response)
+        return response
+    
+    def _is_retryable(self, error: Exception) -> bool:
+        """Only server side failures and lost connections are worth another attempt, client errors are final."""
+        if isinstance(error, ollama.ResponseError):
+            return error.status_code >= 500
+        return isinstance(error, (ConnectionError, httpx.TransportError))
+    
+    def _retry_delay(self, attempt: int, retries: int, deadline: Optional[float]) -> Optional[float]:
+        """
+        Exponential backoff with full jitter before the next attempt.
+        
+        Args:
+            attempt: Zero based number of the attempt that just failed
+            retries: Total number of attempts
+            deadline: time.monotonic() value after which no further attempt is started
+        
+        Returns:
+            Seconds to wait, or None if no attempt is left or the deadline would pass
+        """
+        if attempt >= retries - 1:
+            return None
+        delay = min(self.config.retry_backoff_cap, self.config.retry_backoff_base * 2 ** attempt) * random.random()
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            self.logger.error("Giving up, the next retry would exceed the request deadline")
+            return None
+        return delay
+    
+    def _get_cached_response(self,
+                             model_name: str,
+                             prompt: str,
+                             options: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        """Look up a request in the response cache, returns the cache key and the cached response."""
+        if self.cache is None:
+            return None, None
+        cache_key = LLMCache.make_key(model_name, prompt, options)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug("Using cached LLM response")
+        return cache_key, cached
+    
+    def _set_cached_response(self, cache_key: Optional[str], response: str):
+        """Store a generated response in the response cache."""
+        if cache_key is not None and response:
+            self.cache.set(cache_key, response)
+    
+    def _build_options(self,
+                       temperature: float = None,
+                       top_p: float = None,
+                       stop_sequences: List[str] = None) -> Dict[str, Any]:
+        """Build the Ollama request options, falling back to config values."""
+        options = {
+            'temperature': temperature if temperature is not None else self.config.temperature,
+            'top_p': top_p if top_p is not None else self.config.top_p,
+        }
+        if stop_sequences:
+            options['stop'] = stop_sequences
+        return options
+
+    def stream_response(self,
+                        prompt: str,
+                        model: str = None,
+                        temperature: float = None,
+                        top_p: float = None,
+                        stop_sequences: List[str] = None) -> Iterator[str]:
+        """
+        Generate a response from the LLM, yielding the text as it arrives.
+        
+        Args:
+            prompt: The input prompt
+            model: Model to use, defaults to config model
+            temperature: Sampling temperature, defaults to config value
+            top_p: Top-p sampling parameter, defaults to config value
+            stop_sequences: List of stop sequences
+        
+        Yields:
+            Response text chunks in generation order
+        """
         try:
+            response = self.client.generate(
+                model=model or self.config.model,
+                prompt=prompt,
+                stream=True,
+                options=self._build_options(temperature, top_p, stop_sequences),
+                keep_alive=self.config.keep_alive
+            )
             for chunk in response:
                 if 'response' in chunk:
-                    full_response += chunk['response']
-            return full_response.strip()
+                    yield chunk['response']
+        except Exception as e:
+            self.logger.error(f"Error streaming response: {e}")
+    
+    def _collect_streaming_response(self, response) -> str:
+        """Collect a streaming response from Ollama into a single string."""
+        parts = []
+        try:
+            for chunk in response:
+                if 'response' in chunk:
+                    parts.append(chunk['response'])
+            return "".join(parts).strip()
         except Exception as e:
             self.logger.error(f"Error handling streaming response: {e}")
             return ""
@@ -178,6 +505,8 @@ class LLMAccessLayer:
             
             self.logger.info(f"Pulling model '{model_to_pull}'...")
             self.client.pull(model_to_pull)
+            with self._models_cache_lock:
+                self._models_cache = None
             self.logger.info(f"Successfully pulled model '{model_to_pull}'")
             return True
             
@@ -185,6 +514,32 @@ class LLMAccessLayer:
             self.logger.error(f"Failed to pull model '{model_to_pull}': {e}")
             return False
     
+    def warmup(self, model_name: str = None) -> bool:
+        """
+        Load the model into memory with a one token request, so the first real prompt does not pay for it.
+        
+        Args:
+            model_name: Model name to load, defaults to config model
+        
+        Returns:
+            True if the model answered, False otherwise
+        """
+        model_to_load = model_name or self.config.model
+        
+        try:
+            start = time.monotonic()
+            self.client.generate(
+                model=model_to_load,
+                prompt=".",
+                options={'num_predict': 1, 'temperature': 0},
+                keep_alive=self.config.keep_alive
+            )
+            self.logger.info(f"Model '{model_to_load}' loaded in {time.monotonic() - start:.1f}s")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to warm up model '{model_to_load}': {e}")
+            return False
+    
     def list_available_models(self) -> List[str]:
         """
         Get a list of available models.
@@ -193,8 +548,7 @@ class LLMAccessLayer:
             List of available model names
         """
         try:
-            models = self.client.list()
-            return [model.model for model in models.get('models', [])]
+            return [model.model for model in self._list_models()]
         except Exception as e:
             self.logger.error(f"Failed to list models: {e}")
             return []
@@ -212,8 +566,7 @@ class LLMAccessLayer:
         model_to_check = model_name or self.config.model
         
         try:
-            models = self.client.list()
-            for model in models.get('models', []):
+            for model in self._list_models():
                 model_name_in_list = model.model
                 if (model_to_check in model_name_in_list or 
                     model_name_in_list.startswith(model_to_check)):
@@ -251,11 +604,178 @@ class LLMAccessLayer:
                 options={
                     'temperature': temp,
                     'top_p': top_p_val,
-                }
+                },
+                keep_alive=self.config.keep_alive
             )
             
             return response.get('message', {}).get('content', '').strip()
             
         except Exception as e:
             self.logger.error(f"Chat completion failed: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    async def achat_completion(self,
+                               messages: List[Dict[str, str]],
+                               model: str = None,
+                               temperature: float = None,
+                               top_p: float = None) -> Optional[str]:
+        """
+        Generate a chat completion response without blocking the event loop.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            model: Model to use, defaults to config model
+            temperature: Sampling temperature
+            top_p: Top-p sampling parameter
+        
+        Returns:
+            Generated response string or None if failed
+        """
+        model_name = model or self.config.model
+        
+        try:
+            response = await self.aclient.chat(
+                model=model_name,
+                messages=messages,
+                options=self._build_options(temperature, top_p),
+                keep_alive=self.config.keep_alive
+            )
+            
+            return response.get('message', {}).get('content', '').strip()
+        
+        except Exception as e:
+            self.logger.error(f"Chat completion failed: {e}")
+            return None
+
+
+class BatchingLLMAccessLayer:
+    """Collects prompts submitted concurrently and sends them to Ollama in micro-batches."""
+    
+    def __init__(self, llm_access: LLMAccessLayer = None, max_batch: int = None, batch_window: float = 0.05):
+        """
+        Initialize the batching layer.
+        
+        Args:
+            llm_access: The access layer used to send the requests, a new one is created if omitted
+            max_batch: Maximum number of prompts per batch, defaults to the configured concurrency
+            batch_window: Seconds to wait for more prompts after the first one of a batch arrived
+        """
+        self.llm_access = llm_access or LLMAccessLayer()
+        self.max_batch = max_batch or self.llm_access.config.concurrency
+        self.batch_window = batch_window
+        self.logger = logging.getLogger(__name__)
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._dispatcher_task: Optional[asyncio.Task] = None
+        # The batch the dispatcher is collecting and the batch of every running dispatch task,
+        # kept here so close() can fail their futures even if a task is cancelled before it ever ran
+        self._collecting: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        self._dispatch_batches: Dict[asyncio.Task, List[Tuple[str, Dict[str, Any], asyncio.Future]]] = {}
+        # Set while close() runs, the dispatcher then stops instead of starting another batch
+        self._closed = False
+    
+    async def submit(self, prompt: str, **kwargs) -> Optional[str]:
+        """
+        Queue a prompt for the next batch and wait for its response.
+        
+        Args:
+            prompt: The input prompt
+            **kwargs: Further arguments for LLMAccessLayer.agenerate_response
+        
+        Returns:
+            Generated response string or None if failed
+        
+        Raises:
+            RuntimeError: If the layer is closed before the prompt was answered
+        """
+        if self._closed:
+            raise RuntimeError("Batching layer is closing")
+        if self._dispatcher_task is None or self._dispatcher_task.done():
+            self._queue = asyncio.Queue()
+            self._semaphore = asyncio.Semaphore(self.llm_access.config.concurrency)
+            self._dispatcher_task = asyncio.create_task(self._dispatcher())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((prompt, kwargs, future))
+        return await future
+    
+    async def close(self):
+        """Stop the background dispatcher and fail every prompt that has not been answered yet."""
+        self._closed = True
+        try:
+            if self._dispatcher_task is not None:
+                # A cancel can be swallowed by wait_for when its get() already finished, so repeat until it landed
+                while not self._dispatcher_task.done():
+                    self._dispatcher_task.cancel()
+                    await asyncio.wait([self._dispatcher_task], timeout=self.batch_window)
+                self._fail_unresolved(future for _, _, future in self._collecting)
+                self._collecting = []
+            
+            tasks = list(self._dispatch_batches)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for task in tasks:
+                self._on_dispatch_done(task)
+            
+            # Prompts submitted after the last batch was collected
+            while self._queue is not None and not self._queue.empty():
+                _, _, future = self._queue.get_nowait()
+                self._fail_unresolved([future])
+        finally:
+            self._dispatcher_task = None
+            self._closed = False
+    
+    async def _dispatcher(self):
+        """Collect queued prompts until the batch is full or the window expired, then dispatch them."""
+        loop = asyncio.get_running_loop()
+        while not self._closed:
+            self._collecting = batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch and not self._closed:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            if self._closed:
+                # close() fails the collected batch
+                return
+            # Dispatch in the background so a slow prompt does not hold up collecting the next batch
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatch_batches[task] = batch
+            task.add_done_callback(self._on_dispatch_done)
+            self._collecting = []
+    
+    def _on_dispatch_done(self, task: asyncio.Task):
+        """Fail the futures a finished dispatch task left unresolved, also runs for tasks cancelled before they started."""
+        batch = self._dispatch_batches.pop(task, None)
+        if batch is not None:
+            self._fail_unresolved(future for _, _, future in batch)
+    
+    async def _dispatch(self, batch: List[Tuple[str, Dict[str, Any], asyncio.Future]]):
+        """Send all prompts of a batch concurrently, resolving each future as soon as its prompt is done."""
+        self.logger.debug(f"Dispatching batch of {len(batch)} prompts")
+        await asyncio.gather(*[self._resolve(prompt, kwargs, future) for prompt, kwargs, future in batch])
+    
+    async def _resolve(self, prompt: str, kwargs: Dict[str, Any], future: asyncio.Future):
+        """Generate the response for one prompt once a semaphore slot is free and resolve its future."""
+        async with self._semaphore:
+            try:
+                result = await self.llm_access.agenerate_response(prompt, **kwargs)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                return
+        if not future.done():
+            future.set_result(result)
+    
+    @staticmethod
+    def _fail_unresolved(futures: Iterable[asyncio.Future]):
+        """Fail the futures that have no result yet, so their submitters do not wait forever."""
+        for future in futures:
+            if not future.done():
+                future.set_exception(RuntimeError("Batching layer was closed before the prompt was answered"))
@@ -0,0 +1,70 @@
+"""
+Copyright (C) 2025 Roland Spatzenegger
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Persistent cache for LLM responses.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+
+class LLMCache:
+    """Stores LLM responses in a sqlite database, keyed by model, prompt and options."""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path of the sqlite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # the connection is shared between threads, sqlite access is serialized by the lock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def make_key(model: str, prompt: str, options: Dict[str, Any]) -> str:
+        """Build the cache key for a request."""
+        data = model + "\0" + prompt + "\0" + json.dumps(options, sort_keys=True)
+        return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the cached response for a key, None if there is none."""
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str):
+        """Store a response for a key."""
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)", (key, value))
+            self._connection.commit()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -17,152 +17,296 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 Reporting for Java code structure.
 """
 
-import html
 from collections import defaultdict
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
+from typing import Dict, Iterator, List, Set, Tuple
+from urllib.parse import quote
 
-def escape(s):
-    return html.escape(s, quote=False)
+from java.models import JavaClass, JavaCodeData, JavaMethod
 
-def get_package(class_name):
+# (class name, method name)
+MethodKey = Tuple[str, str]
+
+HTML_HEAD = ('<!DOCTYPE html>\n'
+             '<html lang="en">\n'
+             '<head>\n'
+             '<meta charset="UTF-8">\n'
+             '<title>Java Documentation</title>\n'
+             '<style>\n'
+             'body { font-family: Arial, sans-serif; margin: 0 2em; background: #fafbfc; }\n'
+             '.menu { background: #222d; padding: 1em; border-radius: 8px; margin:1em 0; }\n'
+             '.package { font-weight: bold; margin-top:1em; }\n'
+             '.class-link, .method-link { text-decoration: none; color: #2d66be; cursor:pointer;}\n'
+             '.class-section, .method-section { margin:2em 0; padding:1em; border-radius: 7px; background: #fff; border:1px solid #eee;}\n'
+             '.class-title { font-size: 1.5em; margin-bottom: .2em;}\n'
+             '.block { margin:.5em 0 1em .5em; background:#f5f7fa; border-radius:3px; padding:.8em; border:1px solid #e2e6ea;}\n'
+             '.code {display:block; background:#24292f; color:#fafbfc; font-family:monospace; white-space:pre; border-radius:5px; padding:.7em; margin-top:.4em; font-size: 1em;}\n'
+             '.methods-list { margin-left: 1.5em;}\n'
+             '.method-table { border-collapse: collapse; width:90%; }\n'
+             '.method-table th, .method-table td { border: 1px solid #ccc; padding:.3em .7em;}\n'
+             '.out-list { margin:.2em 0 0 .7em; }\n'
+             '.method-title { font-size:1.2em; }\n'
+             '.section-sep {border-top:1px solid #d2d5d8; margin:2em 0;}\n'
+             '.method-link:hover { text-decoration:underline; }\n'
+             '</style>\n'
+             '</head>\n'
+             '<body>\n')
+NAV_OPEN = ('<h1>Java Documentation Overview</h1>\n'
+            '<nav class="menu">\n'
+            '<strong>Classes by Package:</strong>\n'
+            '<ul>\n')
+NAV_CLOSE = '</ul>\n</nav>\n<hr>\n'
+PACKAGE_CLOSE = '</ul></li>\n'
+JAVADOC_OPEN = '<div class="block"><strong>Javadoc:</strong><br>\n'
+NO_JAVADOC = '<i>No Javadoc available</i>\n'
+BLOCK_CLOSE = '</div>\n'
+METHOD_TABLE_OPEN = ('<div class="block"><strong>Methods:</strong>\n'
+                     '<table class="method-table"><tr><th>Method</th><th>Javadoc</th></tr>\n')
+METHOD_TABLE_CLOSE = '</table>\n</div>\n'
+NO_METHODS = '<div class="block"><strong>No methods in this class.</strong></div>\n'
+CLASS_SECTION_CLOSE = '</section><div class="section-sep"></div>\n'
+METHODS_HEADER = '<h2 id="methods_overview">Methods Details</h2>\n'
+OUT_LIST_OPEN = '<div class="block"><strong>Outgoing Methods (calls):</strong><ul class="out-list">\n'
+OUT_LIST_CLOSE = '</ul></div>\n'
+NO_OUT_METHODS = '<div class="block"><strong>No outgoing methods.</strong></div>\n'
+METHOD_SECTION_CLOSE = '</section>\n'
+HTML_END = '</body></html>'
+
+def escape(s: str) -> str:
+    # same as html.escape(s, quote=False) without the extra call and quote check.
+    # Runs at memory speed; escaping in worker processes costs more in pickling than it saves.
+    return s.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+def get_package(class_name: str) -> str:
     if '.' in class_name:
         return '.'.join(class_name.split('.')[:-1])
     else:
         return '(default package)'
 
-def class_anchor(class_name):
+def class_anchor(class_name: str) -> str:
     return f'class_{class_name.replace(".", "_")}'
 
-def method_anchor(class_name, method_name):
+def method_anchor(class_name: str, method_name: str) -> str:
     return f'method_{class_name.replace(".", "_")}__{method_name}'
 
-def generate_html(java_code_data, out_path):
-    # Organize classes by package
-    packages: Dict[str, list] = defaultdict(list)
+def package_file(pkg: str) -> str:
+    # '-' cannot occur in a Java package name, so no package page can replace index.html
+    return f'package-{pkg}.html'
+
+def package_href(pkg: str) -> str:
+    # the default package name contains a space and parentheses
+    return quote(package_file(pkg))
+
+class _CallLinks(Dict[MethodKey, str]):
+    # Rendered call list entries by (class, method) target, the same targets are called from many methods
+    def __init__(self, method_anchors: Dict[MethodKey, str], per_package: bool = False) -> None:
+        super().__init__()
+        self.method_anchors = method_anchors
+        self.per_package = per_package
+
+    def __missing__(self, key: MethodKey) -> str:
+        class_name, method_name = key
+        out_id = self.method_anchors.get(key) or method_anchor(class_name, method_name)
+        href = f'{package_href(get_package(class_name))}#{out_id}' if self.per_package else f'#{out_id}'
+        link = f'<li><a class="method-link" href="{href}">{escape(class_name)}.{escape(method_name)}</a></li>\n'
+        self[key] = link
+        return link
+
+def _index_java_data(java_code_data: JavaCodeData) -> Tuple[Dict[str, List[JavaClass]],
+                                                             Dict[str, List[JavaMethod]],
+                                                             Dict[MethodKey, JavaMethod],
+                                                             Dict[str, str],
+                                                             Dict[MethodKey, str]]:
+    # Organize classes by package. Hashing into groups and sorting each small group measured
+    # faster than one sort of everything followed by itertools.groupby.
+    packages: Dict[str, List[JavaClass]] = defaultdict(list)
     for cls in java_code_data.classes:
         pkg = get_package(cls.class_name)
         packages[pkg].append(cls)
 
-    # Pre-index methods for quick lookup
-    methods_by_class: Dict[str, list] = defaultdict(list)
-    method_by_fqn: Dict[str, object] = {}
+    # Pre-index methods for quick lookup, the grouping by class is cached on the data and shared between reports
+    methods_by_class = java_code_data.get_methods_grouped_by_class()
+    method_by_fqn: Dict[MethodKey, JavaMethod] = {}
     for method in java_code_data.methods:
-        methods_by_class[method.src.class_name].append(method)
         fqn = (method.src.class_name, method.src.method_name)
         method_by_fqn[fqn] = method
 
-    # Start HTML
-    html_parts = [
-        '<!DOCTYPE html>',
-        '<html lang="en">',
-        '<head>',
-        '<meta charset="UTF-8">',
-        '<title>Java Documentation</title>',
-        '<style>',
-        'body { font-family: Arial, sans-serif; margin: 0 2em; background: #fafbfc; }',
-        '.menu { background: #222d; padding: 1em; border-radius: 8px; margin:1em 0; }',
-        '.package { font-weight: bold; margin-top:1em; }',
-        '.class-link, .method-link { text-decoration: none; color: #2d66be; cursor:pointer;}',
-        '.class-section, .method-section { margin:2em 0; padding:1em; border-radius: 7px; background: #fff; border:1px solid #eee;}',
-        '.class-title { font-size: 1.5em; margin-bottom: .2em;}',
-        '.block { margin:.5em 0 1em .5em; background:#f5f7fa; border-radius:3px; padding:.8em; border:1px solid #e2e6ea;}',
-        '.code {display:block; background:#24292f; color:#fafbfc; font-family:monospace; white-space:pre; border-radius:5px; padding:.7em; margin-top:.4em; font-size: 1em;}',
-        '.methods-list { margin-left: 1.5em;}',
-        '.method-table { border-collapse: collapse; width:90%; }',
-        '.method-table th, .method-table td { border: 1px solid #ccc; padding:.3em .7em;}',
-        '.out-list { margin:.2em 0 0 .7em; }',
-        '.method-title { font-size:1.2em; }',
-        '.section-sep {border-top:1px solid #d2d5d8; margin:2em 0;}',
-        '.method-link:hover { text-decoration:underline; }',
-        '</style>',
-        '</head>',
-        '<body>',
-        '<h1>Java Documentation Overview</h1>',
-        '<nav class="menu">',
-        '<strong>Classes by Package:</strong>',
-        '<ul>'
-    ]
-    # Navigation menu
-    for pkg in sorted(packages):
-        html_parts.append(f'<li class="package">{escape(pkg)}<ul>')
-        for cls in sorted(packages[pkg], key=lambda c: c.class_name):
-            html_parts.append(
-                f'<li><a class="class-link" href="#{class_anchor(cls.class_name)}">{escape(cls.class_name)}</a></li>'
+    # Anchors are referenced from the navigation menu, the sections and the call lists
+    class_anchors = {cls.class_name: class_anchor(cls.class_name) for cls in java_code_data.classes}
+    method_anchors = {fqn: method_anchor(*fqn) for fqn in method_by_fqn}
+
+    # Sort once, the navigation menu and the class and method sections all use the same order
+    classes_sorted = {pkg: sorted(packages[pkg], key=attrgetter('class_name')) for pkg in sorted(packages)}
+    methods_sorted = {class_name: sorted(methods, key=attrgetter('src.method_name'))
+                      for class_name, methods in methods_by_class.items()}
+    return classes_sorted, methods_sorted, method_by_fqn, class_anchors, method_anchors
+
+def _methods_in_order(classes_sorted: Dict[str, List[JavaClass]],
+                      methods_sorted: Dict[str, List[JavaMethod]],
+                      method_by_fqn: Dict[MethodKey, JavaMethod]) -> Iterator[Tuple[str, List[JavaMethod]]]:
+    # (class name, methods) in class section order, then the classes that only appear as method owners
+    seen: Set[str] = set()
+    for classes in classes_sorted.values():
+        for cls in classes:
+            if cls.class_name not in seen:
+                seen.add(cls.class_name)
+                yield cls.class_name, _unique_methods(cls.class_name, methods_sorted, method_by_fqn)
+    for class_name in sorted(methods_sorted.keys() - seen):
+        yield class_name, _unique_methods(class_name, methods_sorted, method_by_fqn)
+
+def _unique_methods(class_name: str,
+                    methods_sorted: Dict[str, List[JavaMethod]],
+                    method_by_fqn: Dict[MethodKey, JavaMethod]) -> List[JavaMethod]:
+    # overloads share one section, the last one read wins
+    return [m for m in methods_sorted.get(class_name, ())
+            if method_by_fqn[(class_name, m.src.method_name)] is m]
+
+def _render_navigation(classes_sorted: Dict[str, List[JavaClass]],
+                       class_anchors: Dict[str, str],
+                       per_package: bool = False) -> str:
+    parts: List[str] = []
+    for pkg, classes in classes_sorted.items():
+        prefix = package_href(pkg) if per_package else ''
+        parts.append(f'<li class="package">{escape(pkg)}<ul>\n')
+        for cls in classes:
+            parts.append(
+                f'<li><a class="class-link" href="{prefix}#{class_anchors[cls.class_name]}">{escape(cls.class_name)}</a></li>\n'
             )
-        html_parts.append('</ul></li>')
-    html_parts.append('</ul>')
-    html_parts.append('</nav>')
-    html_parts.append('<hr>')
-
-    # Class sections
-    for pkg in sorted(packages):
-        for cls in sorted(packages[pkg], key=lambda c: c.class_name):
-            html_parts.append(f'<section class="class-section" id="{class_anchor(cls.class_name)}">')
-            html_parts.append(f'<div class="class-title">{escape(cls.class_name)}</div>')
-            # Javadoc
-            html_parts.append('<div class="block"><strong>Javadoc:</strong><br>')
-            if cls.java_doc:
-                html_parts.append(f'<div>{escape(cls.java_doc)}</div>')
-            else:
-                html_parts.append('<i>No Javadoc available</i>')
-            html_parts.append('</div>')
-            # Code
-            html_parts.append('<div class="block"><strong>Source code:</strong>')
-            html_parts.append(f'<pre class="code">{escape(cls.code)}</pre>')
-            html_parts.append('</div>')
-            # Methods summary
-            methods = methods_by_class.get(cls.class_name, [])
-            if methods:
-                html_parts.append('<div class="block"><strong>Methods:</strong>')
-                html_parts.append('<table class="method-table"><tr><th>Method</th><th>Javadoc</th></tr>')
-                for method in sorted(methods, key=lambda m: m.src.method_name):
-                    method_id = method_anchor(cls.class_name, method.src.method_name)
-                    # Show first line of javadoc (if present)
-                    jdoc_summary = (method.java_doc.splitlines()[0] if method.java_doc else '')
-                    html_parts.append(f'<tr><td><a class="method-link" href="#{method_id}">{escape(method.src.method_name)}</a></td><td>{escape(jdoc_summary)}</td></tr>')
-                html_parts.append('</table>')
-                html_parts.append('</div>')
-            else:
-                html_parts.append('<div class="block"><strong>No methods in this class.</strong></div>')
-
-            html_parts.append('</section><div class="section-sep"></div>')
-
-    # Method sections
-    html_parts.append('<h2 id="methods_overview">Methods Details</h2>')
-    for key in sorted(method_by_fqn.keys()):
-        class_name, method_name = key
-        method = method_by_fqn[key]
-        section_id = method_anchor(class_name, method_name)
-        html_parts.append(f'<section class="method-section" id="{section_id}">')
-        html_parts.append(f'<div class="method-title">{escape(class_name)}.<b>{escape(method_name)}</b></div>')
-        # Javadoc
-        html_parts.append('<div class="block"><strong>Javadoc:</strong><br>')
-        if method.java_doc:
-            html_parts.append(f'<div>{escape(method.java_doc)}</div>')
-        else:
-            html_parts.append('<i>No Javadoc available</i>')
-        html_parts.append('</div>')
-        # Method code
-        html_parts.append('<div class="block"><strong>Method code:</strong>')
-        html_parts.append(f'<pre class="code">{escape(method.code)}</pre>')
-        html_parts.append('</div>')
-        # Outgoing methods
-        if method.dst_methods:
-            html_parts.append('<div class="block"><strong>Outgoing Methods (calls):</strong><ul class="out-list">')
-            for out in method.dst_methods:
-                out_id = method_anchor(out.class_name, out.method_name)
-                html_parts.append(
-                    f'<li><a class="method-link" href="#{out_id}">{escape(out.class_name)}.{escape(out.method_name)}</a></li>'
-                )
-            html_parts.append('</ul></div>')
-        else:
-            html_parts.append('<div class="block"><strong>No outgoing methods.</strong></div>')
-
-        html_parts.append('</section>')
-
-    html_parts.append('</body></html>')
-
-    # Write HTML to file
-    Path(out_path).write_text('\n'.join(html_parts), encoding='utf-8')
+        parts.append(PACKAGE_CLOSE)
+    return ''.join(parts)
+
+def _render_class_section(cls: JavaClass,
+                          methods: List[JavaMethod],
+                          class_id: str,
+                          method_anchors: Dict[MethodKey, str]) -> str:
+    parts = [f'<section class="class-section" id="{class_id}">\n'
+             f'<div class="class-title">{escape(cls.class_name)}</div>\n'
+             f'{JAVADOC_OPEN}',
+             # Javadoc
+             f'<div>{escape(cls.java_doc)}</div>\n' if cls.java_doc else NO_JAVADOC,
+             # Code
+             f'{BLOCK_CLOSE}'
+             f'<div class="block"><strong>Source code:</strong>\n'
+             f'<pre class="code">{escape(cls.code)}</pre>\n'
+             f'{BLOCK_CLOSE}']
+    # Methods summary
+    if methods:
+        parts.append(METHOD_TABLE_OPEN)
+        for method in methods:
+            method_id = method_anchors[(cls.class_name, method.src.method_name)]
+            # Show first line of javadoc (if present)
+            jdoc_summary = (method.java_doc.splitlines()[0] if method.java_doc else '')
+            parts.append(f'<tr><td><a class="method-link" href="#{method_id}">{escape(method.src.method_name)}</a></td><td>{escape(jdoc_summary)}</td></tr>\n')
+        parts.append(METHOD_TABLE_CLOSE)
+    else:
+        parts.append(NO_METHODS)
+    parts.append(CLASS_SECTION_CLOSE)
+    return ''.join(parts)
+
+def _render_method_section(method: JavaMethod, section_id: str, call_links: Dict[MethodKey, str]) -> str:
+    class_name, method_name = method.src.class_name, method.src.method_name
+    parts = [f'<section class="method-section" id="{section_id}">\n'
+             f'<div class="method-title">{escape(class_name)}.<b>{escape(method_name)}</b></div>\n'
+             f'{JAVADOC_OPEN}',
+             # Javadoc
+             f'<div>{escape(method.java_doc)}</div>\n' if method.java_doc else NO_JAVADOC,
+             # Method code
+             f'{BLOCK_CLOSE}'
+             f'<div class="block"><strong>Method code:</strong>\n'
+             f'<pre class="code">{escape(method.code)}</pre>\n'
+             f'{BLOCK_CLOSE}']
+    # Outgoing methods
+    if method.dst_methods:
+        parts.append(OUT_LIST_OPEN)
+        for out in method.dst_methods:
+            parts.append(call_links[(out.class_name, out.method_name)])
+        parts.append(OUT_LIST_CLOSE)
+    else:
+        parts.append(NO_OUT_METHODS)
+    parts.append(METHOD_SECTION_CLOSE)
+    return ''.join(parts)
+
+def generate_html(java_code_data: JavaCodeData, out_path: str) -> None:
+    classes_sorted, methods_sorted, method_by_fqn, class_anchors, method_anchors = _index_java_data(java_code_data)
+    call_links = _CallLinks(method_anchors)
+
+    # Write the HTML straight to the file instead of collecting it in memory
+    with open(out_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        write = f.write
+        write(HTML_HEAD)
+        write(NAV_OPEN)
+        # Navigation menu
+        write(_render_navigation(classes_sorted, class_anchors))
+        write(NAV_CLOSE)
+
+        # Class sections
+        for classes in classes_sorted.values():
+            for cls in classes:
+                write(_render_class_section(cls, methods_sorted.get(cls.class_name, []),
+                                            class_anchors[cls.class_name], method_anchors))
+
+        # Method sections, in the order of the class sections
+        write(METHODS_HEADER)
+        for _, methods in _methods_in_order(classes_sorted, methods_sorted, method_by_fqn):
+            for method in methods:
+                section_id = method_anchors[(method.src.class_name, method.src.method_name)]
+                write(_render_method_section(method, section_id, call_links))
+
+        write(HTML_END)
+
     print(f'HTML documentation written to {out_path}')
+
+def _render_package(pkg: str,
+                    classes: List[JavaClass],
+                    methods: List[JavaMethod],
+                    methods_sorted: Dict[str, List[JavaMethod]],
+                    class_anchors: Dict[str, str],
+                    method_anchors: Dict[MethodKey, str],
+                    call_links: Dict[MethodKey, str]) -> str:
+    parts = [HTML_HEAD,
+             f'<h1>{escape(pkg)}</h1>\n'
+             f'<a class="class-link" href="index.html">Back to the overview</a>\n'
+             f'<hr>\n']
+    for cls in classes:
+        parts.append(_render_class_section(cls, methods_sorted.get(cls.class_name, []),
+                                           class_anchors[cls.class_name], method_anchors))
+    parts.append(METHODS_HEADER)
+    for method in methods:
+        section_id = method_anchors[(method.src.class_name, method.src.method_name)]
+        parts.append(_render_method_section(method, section_id, call_links))
+    parts.append(HTML_END)
+    return ''.join(parts)
+
+def generate_html_per_package(java_code_data: JavaCodeData, out_dir: str) -> None:
+    # One page per package plus an index page with the navigation menu,
+    # browsers render many small pages far better than one page for the whole code base
+    out_path = Path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+    classes_sorted, methods_sorted, method_by_fqn, class_anchors, method_anchors = _index_java_data(java_code_data)
+    call_links = _CallLinks(method_anchors, per_package=True)
+
+    # Methods go to the page of their class' package, even when the class itself has no entry
+    package_methods: Dict[str, List[JavaMethod]] = defaultdict(list)
+    for class_name, methods in _methods_in_order(classes_sorted, methods_sorted, method_by_fqn):
+        package_methods[get_package(class_name)].extend(methods)
+
+    def write_package(pkg: str) -> None:
+        html = _render_package(pkg, classes_sorted.get(pkg, []), package_methods.get(pkg, []),
+                               methods_sorted, class_anchors, method_anchors, call_links)
+        with open(out_path / package_file(pkg), 'w', encoding='utf-8') as f:
+            f.write(html)
+
+    # Rendering holds the GIL, the threads overlap the file writes
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(write_package, classes_sorted.keys() | package_methods.keys()))
+
+    with open(out_path / 'index.html', 'w', encoding='utf-8') as f:
+        f.write(HTML_HEAD)
+        f.write(NAV_OPEN)
+        f.write(_render_navigation(classes_sorted, class_anchors, per_package=True))
+        f.write(NAV_CLOSE)
+        f.write(HTML_END)
+
+    print(f'HTML documentation written to {out_dir}')
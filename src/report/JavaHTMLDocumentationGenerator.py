@@ -17,225 +17,14 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 Reporting for Java code structure.
 """
 
-import html
-from typing import Dict, List
+import re
+import sys
+from typing import Dict, List, Set, TextIO, Tuple
 from java.models import JavaCodeData, JavaClass, JavaMethod, MethodReference
 
+_HTML_SPECIAL = re.compile(r'[&<>"\']')
 
-class JavaCodeHTMLGenerator:
-    """Generates HTML documentation from JavaCodeData."""
-    
-    def __init__(self, java_code_data: JavaCodeData):
-        self.data = java_code_data
-        self.packages = self._organize_by_packages()
-    
-    def _organize_by_packages(self) -> Dict[str, List[JavaClass]]:
-        """Organize classes by their packages."""
-        packages = {}
-        
-        for java_class in self.data.classes:
-            # Extract package from class name (assuming format like com.example.ClassName)
-            class_parts = java_class.class_name.split('.')
-            if len(class_parts) > 1:
-                package_name = '.'.join(class_parts[:-1])
-                class_name = class_parts[-1]
-            else:
-                package_name = "(default)"
-                class_name = java_class.class_name
-            
-            if package_name not in packages:
-                packages[package_name] = []
-            
-            packages[package_name].append(java_class)
-        
-        # Sort classes within each package
-        for package in packages.values():
-            package.sort(key=lambda cls: cls.class_name)
-        
-        return packages
-    
-    def _escape_html(self, text: str) -> str:
-        """Escape HTML special characters."""
-        return html.escape(text) if text else ""
-    
-    def _generate_navigation(self) -> str:
-        """Generate the navigation menu HTML."""
-        nav_html = """
-        <nav class="navigation">
-            <h2>Classes by Package</h2>
-            <div class="package-list">
-        """
-        
-        # Sort packages alphabetically
-        sorted_packages = sorted(self.packages.keys())
-        
-        for package_name in sorted_packages:
-            classes = self.packages[package_name]
-            nav_html += f"""
-                <div class="package">
-                    <h3 class="package-name">{self._escape_html(package_name)}</h3>
-                    <ul class="class-list">
-            """
-            
-            for java_class in classes:
-                class_id = self._get_class_id(java_class.class_name)
-                simple_name = java_class.class_name.split('.')[-1]
-                nav_html += f"""
-                        <li><a href="#{class_id}" class="class-link">{self._escape_html(simple_name)}</a></li>
-                """
-            
-            nav_html += """
-                    </ul>
-                </div>
-            """
-        
-        nav_html += """
-            </div>
-        </nav>
-        """
-        
-        return nav_html
-    
-    def _get_class_id(self, class_name: str) -> str:
-        """Generate a valid HTML ID for a class."""
-        return f"class-{class_name.replace('.', '-')}"
-    
-    def _get_method_id(self, class_name: str, method_name: str) -> str:
-        """Generate a valid HTML ID for a method."""
-        return f"method-{class_name.replace('.', '-')}-{method_name}"
-    
-    def _generate_class_section(self, java_class: JavaClass) -> str:
-        """Generate HTML section for a class."""
-        class_id = self._get_class_id(java_class.class_name)
-        simple_name = java_class.class_name.split('.')[-1]
-        
-        html_content = f"""
-        <section class="class-section" id="{class_id}">
-            <h2 class="class-title">{self._escape_html(simple_name)}</h2>
-            <p class="full-class-name">Full name: {self._escape_html(java_class.class_name)}</p>
-            
-            <div class="class-content">
-                <div class="javadoc-section">
-                    <h3>Documentation</h3>
-                    <div class="javadoc">
-        """
-        
-        if java_class.java_doc:
-            html_content += f"<pre>{self._escape_html(java_class.java_doc)}</pre>"
-        else:
-            html_content += "<p><em>No documentation available</em></p>"
-        
-        html_content += """
-                    </div>
-                </div>
-                
-                <div class="code-section">
-                    <h3>Source Code</h3>
-                    <pre class="code"><code>"""
-        
-        html_content += self._escape_html(java_class.code)
-        
-        html_content += """</code></pre>
-                </div>
-                
-                <div class="methods-section">
-                    <h3>Methods</h3>
-        """
-        
-        # Get methods for this class
-        class_methods = self.data.get_methods_by_class(java_class.class_name)
-        
-        if class_methods:
-            html_content += "<ul class='method-list'>"
-            for method in class_methods:
-                method_id = self._get_method_id(method.src.class_name, method.src.method_name)
-                html_content += f"""
-                    <li><a href="#{method_id}" class="method-link">{self._escape_html(method.src.method_name)}</a></li>
-                """
-            html_content += "</ul>"
-        else:
-            html_content += "<p><em>No methods found</em></p>"
-        
-        html_content += """
-                </div>
-            </div>
-        </section>
-        """
-        
-        return html_content
-    
-    def _generate_method_section(self, method: JavaMethod) -> str:
-        """Generate HTML section for a method."""
-        method_id = self._get_method_id(method.src.class_name, method.src.method_name)
-        
-        html_content = f"""
-        <section class="method-section" id="{method_id}">
-            <h2 class="method-title">{self._escape_html(method.src.method_name)}</h2>
-            <p class="method-class">Class: {self._escape_html(method.src.class_name)}</p>
-            
-            <div class="method-content">
-                <div class="method-javadoc-section">
-                    <h3>Documentation</h3>
-                    <div class="javadoc">
-        """
-        
-        if method.java_doc:
-            html_content += f"<pre>{self._escape_html(method.java_doc)}</pre>"
-        else:
-            html_content += "<p><em>No documentation available</em></p>"
-        
-        html_content += """
-                    </div>
-                </div>
-                
-                <div class="method-code-section">
-                    <h3>Source Code</h3>
-                    <pre class="code"><code>"""
-        
-        html_content += self._escape_html(method.code)
-        
-        html_content += """</code></pre>
-                </div>
-                
-                <div class="outgoing-methods-section">
-                    <h3>Called Methods</h3>
-        """
-        
-        if method.dst_methods:
-            html_content += "<ul class='outgoing-method-list'>"
-            for dst_method in method.dst_methods:
-                # Try to find if we have this method in our data
-                target_method = self.data.get_method_by_name(
-                    type('MethodSource', (), {
-                        'class_name': dst_method.class_name,
-                        'method_name': dst_method.method_name
-                    })()
-                )
-                
-                if target_method:
-                    target_id = self._get_method_id(dst_method.class_name, dst_method.method_name)
-                    html_content += f"""
-                        <li><a href="#{target_id}" class="outgoing-method-link">{self._escape_html(dst_method.class_name)}.{self._escape_html(dst_method.method_name)}</a></li>
-                    """
-                else:
-                    html_content += f"""
-                        <li class="external-method">{self._escape_html(dst_method.class_name)}.{self._escape_html(dst_method.method_name)} <em>(external)</em></li>
-                    """
-            html_content += "</ul>"
-        else:
-            html_content += "<p><em>No outgoing method calls</em></p>"
-        
-        html_content += """
-                </div>
-            </div>
-        </section>
-        """
-        
-        return html_content
-    
-    def _generate_css(self) -> str:
-        """Generate CSS styles for the HTML."""
-        return """
+_CSS = """
         <style>
             body {
                 font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
@@ -502,37 +291,287 @@ class JavaCodeHTMLGenerator:
             }
         </style>
         """
+
+
+class JavaCodeHTMLGenerator:
+    """Generates HTML documentation from JavaCodeData."""
+    
+    def __init__(self, java_code_data: JavaCodeData) -> None:
+        self.data = java_code_data
+        # Escaped package, class and method names, each name is written many times
+        self._escaped_names: Dict[str, str] = {}
+        # Class and method names are split, escaped and turned into ids once, the sections only look them up
+        self._class_meta = self._build_class_meta()
+        self._method_ids: Dict[Tuple[str, str], str] = {
+            (method.src.class_name, method.src.method_name):
+                f"method-{method.src.class_name.replace('.', '-')}-{method.src.method_name}"
+            for method in self.data.methods
+        }
+        # Cached on the data, the other report generator uses the same grouping
+        self._methods_by_class = self.data.get_methods_grouped_by_class()
+        self.packages = self._organize_by_packages()
+    
+    def _build_class_meta(self) -> Dict[str, Tuple[str, str, str, str]]:
+        """Map each class name to its package, simple name, HTML id and escaped simple name."""
+        class_meta: Dict[str, Tuple[str, str, str, str]] = {}
+        
+        for java_class in self.data.classes:
+            # Extract package from class name (assuming format like com.example.ClassName)
+            class_parts = java_class.class_name.split('.')
+            if len(class_parts) > 1:
+                # Every class of a package shares one package name string
+                package_name = sys.intern('.'.join(class_parts[:-1]))
+            else:
+                package_name = "(default)"
+            simple_name = class_parts[-1]
+            
+            class_meta[java_class.class_name] = (
+                package_name,
+                simple_name,
+                f"class-{java_class.class_name.replace('.', '-')}",
+                self._escape_name(simple_name)
+            )
+        
+        return class_meta
+    
+    def _organize_by_packages(self) -> Dict[str, List[JavaClass]]:
+        """Organize classes by their packages."""
+        packages: Dict[str, List[JavaClass]] = {}
+        
+        for java_class in self.data.classes:
+            package_name = self._class_meta[java_class.class_name][0]
+            
+            if package_name not in packages:
+                packages[package_name] = []
+            
+            packages[package_name].append(java_class)
+        
+        # Sort classes within each package
+        for package in packages.values():
+            package.sort(key=lambda cls: cls.class_name)
+        
+        return packages
+    
+    def _escape_html(self, text: str) -> str:
+        """Escape HTML special characters, the same as html.escape but without its extra call overhead."""
+        if not text:
+            return ""
+        return (text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+                .replace('"', "&quot;").replace("'", "&#x27;"))
     
-    def generate_html(self, output_file: str = "java_documentation.html"):
+    def _escape_name(self, name: str) -> str:
+        """Escape a package, class or method name, which almost never contains HTML special characters."""
+        escaped = self._escaped_names.get(name)
+        if escaped is None:
+            # One regex scan is cheaper than five replace calls on short strings, but not on code or javadoc
+            if not name or _HTML_SPECIAL.search(name) is None:
+                escaped = name or ""
+            else:
+                escaped = self._escape_html(name)
+            self._escaped_names[name] = escaped
+        return escaped
+    
+    def _generate_navigation(self, out: TextIO) -> None:
+        """Write the navigation menu HTML."""
+        out.write("""
+        <nav class="navigation">
+            <h2>Classes by Package</h2>
+            <div class="package-list">
+        """)
+        
+        # Sort packages alphabetically
+        sorted_packages = sorted(self.packages.keys())
+        
+        for package_name in sorted_packages:
+            classes = self.packages[package_name]
+            out.write(f"""
+                <div class="package">
+                    <h3 class="package-name">{self._escape_name(package_name)}</h3>
+                    <ul class="class-list">
+            """)
+            
+            for java_class in classes:
+                _, _, class_id, escaped_name = self._class_meta[java_class.class_name]
+                out.write(f"""
+                        <li><a href="#{class_id}" class="class-link">{escaped_name}</a></li>
+                """)
+            
+            out.write("""
+                    </ul>
+                </div>
+            """)
+        
+        out.write("""
+            </div>
+        </nav>
+        """)
+    
+    def _generate_class_section(self, java_class: JavaClass, out: TextIO) -> None:
+        """Write the HTML section for a class."""
+        _, _, class_id, escaped_name = self._class_meta[java_class.class_name]
+        
+        out.write(f"""
+        <section class="class-section" id="{class_id}">
+            <h2 class="class-title">{escaped_name}</h2>
+            <p class="full-class-name">Full name: {self._escape_name(java_class.class_name)}</p>
+            
+            <div class="class-content">
+                <div class="javadoc-section">
+                    <h3>Documentation</h3>
+                    <div class="javadoc">
+        """)
+        
+        if java_class.java_doc:
+            out.write(f"<pre>{self._escape_html(java_class.java_doc)}</pre>")
+        else:
+            out.write("<p><em>No documentation available</em></p>")
+        
+        out.write("""
+                    </div>
+                </div>
+                
+                <div class="code-section">
+                    <h3>Source Code</h3>
+                    <pre class="code"><code>""")
+        
+        out.write(self._escape_html(java_class.code))
+        
+        out.write("""</code></pre>
+                </div>
+                
+                <div class="methods-section">
+                    <h3>Methods</h3>
+        """)
+        
+        # Get methods for this class
+        class_methods = self._methods_by_class.get(java_class.class_name, ())
+        
+        if class_methods:
+            out.write("<ul class='method-list'>")
+            for method in class_methods:
+                method_id = self._method_ids[(method.src.class_name, method.src.method_name)]
+                out.write(f"""
+                    <li><a href="#{method_id}" class="method-link">{self._escape_name(method.src.method_name)}</a></li>
+                """)
+            out.write("</ul>")
+        else:
+            out.write("<p><em>No methods found</em></p>")
+        
+        out.write("""
+                </div>
+            </div>
+        </section>
+        """)
+    
+    def _generate_method_section(self, method: JavaMethod, out: TextIO) -> None:
+        """Write the HTML section for a method."""
+        method_id = self._method_ids[(method.src.class_name, method.src.method_name)]
+        
+        out.write(f"""
+        <section class="method-section" id="{method_id}">
+            <h2 class="method-title">{self._escape_name(method.src.method_name)}</h2>
+            <p class="method-class">Class: {self._escape_name(method.src.class_name)}</p>
+            
+            <div class="method-content">
+                <div class="method-javadoc-section">
+                    <h3>Documentation</h3>
+                    <div class="javadoc">
+        """)
+        
+        if method.java_doc:
+            out.write(f"<pre>{self._escape_html(method.java_doc)}</pre>")
+        else:
+            out.write("<p><em>No documentation available</em></p>")
+        
+        out.write("""
+                    </div>
+                </div>
+                
+                <div class="method-code-section">
+                    <h3>Source Code</h3>
+                    <pre class="code"><code>""")
+        
+        out.write(self._escape_html(method.code))
+        
+        out.write("""</code></pre>
+                </div>
+                
+                <div class="outgoing-methods-section">
+                    <h3>Called Methods</h3>
+        """)
+        
+        if method.dst_methods:
+            out.write("<ul class='outgoing-method-list'>")
+            for dst_method in method.dst_methods:
+                # Try to find if we have this method in our data, only known methods have an id
+                target_id = self._method_ids.get((dst_method.class_name, dst_method.method_name))
+                
+                if target_id is not None:
+                    out.write(f"""
+                        <li><a href="#{target_id}" class="outgoing-method-link">{self._escape_name(dst_method.class_name)}.{self._escape_name(dst_method.method_name)}</a></li>
+                    """)
+                else:
+                    out.write(f"""
+                        <li class="external-method">{self._escape_name(dst_method.class_name)}.{self._escape_name(dst_method.method_name)} <em>(external)</em></li>
+                    """)
+            out.write("</ul>")
+        else:
+            out.write("<p><em>No outgoing method calls</em></p>")
+        
+        out.write("""
+                </div>
+            </div>
+        </section>
+        """)
+    
+    def _generate_css(self, out: TextIO) -> None:
+        """Write the CSS styles for the HTML."""
+        out.write(_CSS)
+    
+    def generate_html(self, output_file: str = "java_documentation.html") -> None:
         """Generate the complete HTML documentation."""
-        html_content = f"""
+        # Write the fragments straight to the file, the document is never held in memory as a whole
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as out:
+            out.write("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Java Code Documentation</title>
-    {self._generate_css()}
+    """)
+            self._generate_css(out)
+            out.write("""
 </head>
 <body>
     <div class="container">
-        {self._generate_navigation()}
+        """)
+            self._generate_navigation(out)
+            out.write("""
         
         <main class="main-content">
             <h1>Java Code Documentation</h1>
             
             <!-- Class Sections -->
-        """
-        
-        # Generate class sections
-        for java_class in self.data.classes:
-            html_content += self._generate_class_section(java_class)
-        
-        # Generate method sections
-        for method in self.data.methods:
-            html_content += self._generate_method_section(method)
-        
-        html_content += """
+        """)
+            
+            # Generate class sections in navigation order, each followed by the sections of its methods
+            # (serially: pickling the data for worker processes takes longer than rendering all sections)
+            written_classes: Set[str] = set()
+            for package_name in sorted(self.packages.keys()):
+                for java_class in self.packages[package_name]:
+                    self._generate_class_section(java_class, out)
+                    if java_class.class_name not in written_classes:
+                        written_classes.add(java_class.class_name)
+                        for method in self._methods_by_class.get(java_class.class_name, ()):
+                            self._generate_method_section(method, out)
+            
+            # Methods of classes without a class entry still get a section
+            for method in self.data.methods:
+                if method.src.class_name not in written_classes:
+                    self._generate_method_section(method, out)
+            
+            out.write("""
         </main>
     </div>
 
@@ -561,16 +600,12 @@ class JavaCodeHTMLGenerator:
     </script>
 </body>
 </html>
-        """
-        
-        # Write to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        """)
         
         print(f"HTML documentation generated: {output_file}")
 
 
-def generate_java_documentation(java_code_data: JavaCodeData, output_file: str = "java_documentation.html"):
+def generate_java_documentation(java_code_data: JavaCodeData, output_file: str = "java_documentation.html") -> None:
     """
     Generate HTML documentation from JavaCodeData.
     
@@ -22,7 +22,7 @@ from report.JavaHTMLDocumentationGenerator import JavaCodeHTMLGenerator
 
 
 def main():
-    java_data = builder.read_structure("../data/")
+    java_data = builder.read_structure_cached("../data/")
     generate_html(java_data, "../data/doc_chathpt.html")
 
     reporter = JavaCodeHTMLGenerator(java_data)